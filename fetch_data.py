@@ -7,6 +7,8 @@ This script fetches:
   - XAUUSD falls back to TIME_SERIES_DAILY and then to the FRED GOLDAMGBD228NLBM series when unavailable
 * Optional central bank balance sheet CSV if CB_SHEETS_CSV_URL is provided, saved as cb_sheets.json
 
+Each series is also written as a columnar <name>.parquet file (date32 dates, float64 values).
+
 Environment variables required:
 - FRED_API_KEY
 - ALPHAVANTAGE_API_KEY
@@ -14,22 +16,58 @@ Environment variables required:
 
 from __future__ import annotations
 
-import csv
-import json
+import asyncio
+import hashlib
+import math
+import operator
 import os
 import sys
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+from requests.adapters import HTTPAdapter
 
 DATA_DIR = Path(__file__).parent / "data"
+CACHE_DIR = Path(__file__).parent / "cache"
 FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 ALPHA_BASE_URL = "https://www.alphavantage.co/query"
 FRED_GOLD_SERIES_ID = "GOLDAMGBD228NLBM"  # LBMA Gold Price AM USD
 
+# Remembers which XAU/USD endpoint ("fx_daily", "ts_daily" or "fred") last worked so later
+# runs can skip the failing probes; the full chain is re-probed once the record is too old.
+XAUUSD_SOURCE_FILE = DATA_DIR / ".xauusd_source"
+XAUUSD_SOURCE_MAX_AGE_DAYS = 7
+
+# API keys are resolved once at import time and passed to the fetchers explicitly.
+_FRED_KEY = os.environ.get("FRED_API_KEY")
+_ALPHA_KEY = os.environ.get("ALPHAVANTAGE_API_KEY")
+
+# Placeholder strings the APIs use for missing observations.
+_SENTINELS = frozenset({"", ".", "NA", "nan", "NaN", "None"})
+
+# Raw API payloads are cached under ./cache so repeat runs skip the network while fresh.
+# Set FORCE_REFRESH to any non-empty value to ignore the cache.
+FRED_CACHE_TTL = 24 * 60 * 60
+ALPHA_CACHE_TTL = 12 * 60 * 60
+
+# One keep-alive session for every request so repeated calls to the same host (notably the
+# XAU/USD fallback chain) reuse an established TLS connection instead of reconnecting.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+# Accept-Encoding is left at the library default, which already advertises every
+# compression scheme urllib3 can decode.
+_SESSION.headers.update({"User-Agent": "gold-dashboard/1.0"})
+
 
 @dataclass(frozen=True)
 class SeriesConfig:
@@ -72,31 +110,186 @@ SERIES_CONFIG: Dict[str, SeriesConfig] = {
 }
 
 
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to a rate-limited API.
+
+    ``rate`` is the refill rate in tokens per second. When the API reports throttling,
+    :meth:`backoff` cuts the rate multiplicatively so subsequent requests wait longer;
+    :meth:`recover` raises it additively after successful requests, back up to ``rate``.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def backoff(self, factor: float = 0.5) -> None:
+        """Slow the refill rate and drain the bucket after a throttled response."""
+        with self._lock:
+            self.rate *= factor
+            self._tokens = 0.0
+
+    def recover(self, fraction: float = 0.25) -> None:
+        """Raise the refill rate by ``fraction`` of the configured rate after a success."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * fraction)
+
+
+# Alpha Vantage free tier allows 5 requests per minute; FRED allows 120 per minute.
+_ALPHA_BUCKET = TokenBucket(rate=5 / 60, burst=5)
+_FRED_BUCKET = TokenBucket(rate=2.0, burst=10)
+ALPHA_MAX_RETRIES = 2
+
+
 def ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def float_or_none(value: Any) -> Optional[float]:
-    try:
-        if isinstance(value, (int, float)):
+    # API values are almost always strings, so check that case first and reject the
+    # missing-value sentinels with a set lookup before attempting the conversion.
+    if isinstance(value, str):
+        value = value.strip()
+        if value in _SENTINELS:
+            return None
+        try:
             return float(value)
-        s = str(value).strip()
-    except Exception:
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _cache_path(source: str, ident: str) -> Path:
+    key = hashlib.md5(f"{source}|{ident}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _read_cache_entry(source: str, ident: str) -> Optional[Dict[str, Any]]:
+    """Return the cached ``{"etag", "last_modified", "body"}`` entry regardless of its age."""
+    if os.environ.get("FORCE_REFRESH"):
         return None
-    if s in {"", ".", "NA", "nan", "NaN", "None"}:
+    try:
+        entry = orjson.loads(_cache_path(source, ident).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "body" not in entry:
         return None
+    return entry
+
+
+def _read_cache(source: str, ident: str, ttl: float) -> Optional[Dict[str, Any]]:
+    """Return the cached raw payload for ``source``/``ident`` if it is younger than ``ttl``."""
     try:
-        return float(s)
-    except ValueError:
+        if time.time() - _cache_path(source, ident).stat().st_mtime >= ttl:
+            return None
+    except OSError:
         return None
+    entry = _read_cache_entry(source, ident)
+    return entry["body"] if entry is not None else None
+
+
+def _write_cache(
+    source: str,
+    ident: str,
+    payload: Dict[str, Any],
+    headers: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Store ``payload`` with the response validators needed for a later conditional GET."""
+    headers = headers or {}
+    entry = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "body": payload,
+    }
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(_cache_path(source, ident), orjson.dumps(entry))
+
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    """Write ``blob`` to a sibling temp file and move it over ``path`` in one step."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
 
 
-def save_json(filename: str, data: Any) -> None:
+def _float_or_nan(value: Any) -> float:
+    parsed = float_or_none(value)
+    return math.nan if parsed is None else parsed
+
+
+async def save_json(filename: str, data: Any) -> None:
     path = DATA_DIR / filename
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Compact output by default; set PRETTY_JSON=1 for indented files when debugging.
+    option = orjson.OPT_INDENT_2 if os.environ.get("PRETTY_JSON") == "1" else 0
+    blob = orjson.dumps(data, option=option)
+    # Keep the blocking file write off the event loop so other fetches keep progressing.
+    await asyncio.to_thread(_write_atomic, path, blob)
+    print(f"Wrote {path}")
+
+
+def save_columnar(stem: str, series: List[Dict[str, Any]]) -> None:
+    """Write ``series`` to ``<stem>.parquet`` with a date32 ``date`` column and float64 values."""
+    value_names = [name for name in (series[0] if series else {}) if name != "date"]
+    dates = np.array([row["date"] for row in series], dtype="datetime64[D]")
+    arrays = [pa.array(dates, type=pa.date32())]
+    arrays += [pa.array([row.get(name) for row in series], type=pa.float64()) for name in value_names]
+    table = pa.table(arrays, names=["date", *value_names])
+    path = DATA_DIR / f"{stem}.parquet"
+    # Same write-then-rename as _write_atomic so an interrupted run never leaves a
+    # truncated file in data/.
+    tmp = path.with_name(f"{path.name}.tmp")
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, path)
     print(f"Wrote {path}")
 
 
+def _alpha_get(params: Dict[str, str]) -> Dict[str, Any]:
+    """GET an Alpha Vantage query, pacing requests and backing off when throttled.
+
+    A throttled response (HTTP 429 or a "Note" payload) halves the bucket rate and retries
+    up to ``ALPHA_MAX_RETRIES`` times; the last throttled payload is returned so callers
+    still report it through :func:`_check_alpha_errors`. Any other response lets the bucket
+    rate climb back toward its configured value. "Information" payloads (premium-only
+    endpoints, daily quota) are returned as-is since retrying cannot help.
+    """
+    for attempt in range(ALPHA_MAX_RETRIES + 1):
+        if attempt:
+            print(
+                f"Alpha Vantage throttled {params['function']}, backing off before retrying...",
+                file=sys.stderr,
+            )
+            _ALPHA_BUCKET.backoff()
+        _ALPHA_BUCKET.acquire()
+        response = _SESSION.get(ALPHA_BASE_URL, params=params, timeout=30)
+        if response.status_code == 429:
+            continue
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        if "Note" not in payload:
+            _ALPHA_BUCKET.recover()
+            return payload
+    response.raise_for_status()
+    return payload
+
+
 def _check_alpha_errors(payload: Dict[str, Any], label: str) -> None:
     """Raise a helpful error message when Alpha Vantage throttles or errors."""
     if "Error Message" in payload:
@@ -106,71 +299,104 @@ def _check_alpha_errors(payload: Dict[str, Any], label: str) -> None:
         raise RuntimeError(
             "Alpha Vantage request was throttled. Please wait and retry or reduce frequency."
         )
+    if "Information" in payload:
+        # Premium-only endpoint or daily quota: not retryable, and the series just comes
+        # back empty, so report it without failing the run.
+        print(f"Alpha Vantage notice for {label}: {payload['Information']}", file=sys.stderr)
+
+
+def _get_fred_payload(series_id: str, params: Dict[str, str]) -> Dict[str, Any]:
+    """GET FRED observations, revalidating a stale cache entry with a conditional request."""
+    entry = _read_cache_entry("fred", series_id)
+    headers: Dict[str, str] = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    _FRED_BUCKET.acquire()
+    response = _SESSION.get(FRED_BASE_URL, params=params, headers=headers, timeout=30)
+    if response.status_code == 304 and entry is not None:
+        # Unchanged upstream: restart the TTL without rewriting the body.
+        os.utime(_cache_path("fred", series_id))
+        return entry["body"]
+    response.raise_for_status()
+    payload = orjson.loads(response.content)
+    _write_cache("fred", series_id, payload, response.headers)
+    return payload
 
 
-def fetch_fred_series(series_id: str) -> List[Dict[str, Any]]:
-    api_key = os.environ.get("FRED_API_KEY")
-    if not api_key:
-        raise RuntimeError("FRED_API_KEY is not set")
-
+def fetch_fred_series(series_id: str, api_key: str) -> List[Dict[str, Any]]:
     params = {
         "series_id": series_id,
         "api_key": api_key,
         "file_type": "json",
         "observation_start": "2000-01-01",
     }
-    response = requests.get(FRED_BASE_URL, params=params, timeout=30)
-    response.raise_for_status()
-    payload = response.json()
+    payload = _read_cache("fred", series_id, FRED_CACHE_TTL)
+    if payload is None:
+        payload = _get_fred_payload(series_id, params)
 
     observations: Iterable[Dict[str, str]] = payload.get("observations", [])
-    series: List[Dict[str, Any]] = []
-    for obs in observations:
-        value = float_or_none(obs.get("value", ""))
-        if value is None:
-            continue
-        date_str = obs.get("date")
-        if not date_str:
-            continue
-        series.append({"date": date_str, "value": value})
-
-    series.sort(key=lambda item: datetime.fromisoformat(item["date"]))
-    return series
+    return sorted(
+        (
+            {"date": obs["date"], "value": value}
+            for obs in observations
+            if (value := float_or_none(obs.get("value", ""))) is not None and obs.get("date")
+        ),
+        key=operator.itemgetter("date"),
+    )
 
 
-def _fred_gold_close_series() -> List[Dict[str, Any]]:
+def _fred_gold_close_series(api_key: Optional[str]) -> List[Dict[str, Any]]:
     """Return LBMA Gold (AM fix) from FRED as [{date, close}] to match FX/Equity schema."""
     print(
         "Falling back to FRED gold price series GOLDAMGBD228NLBM (London AM fix, 10:30) for XAU/USD..."
     )
-    series = fetch_fred_series(FRED_GOLD_SERIES_ID)
+    if not api_key:
+        raise RuntimeError("FRED_API_KEY is not set")
+    series = fetch_fred_series(FRED_GOLD_SERIES_ID, api_key)
     if not series:
         raise RuntimeError("FRED gold price series returned no observations")
 
-    converted: List[Dict[str, Any]] = []
-    for item in series:
-        value = float_or_none(item.get("value"))
-        date = item.get("date")
-        if value is None or not date:
-            continue
-        converted.append({"date": date, "close": value})
+    # fetch_fred_series already drops missing values and sorts by date.
+    return [{"date": item["date"], "close": item["value"]} for item in series]
 
-    if not converted:
-        raise RuntimeError("FRED gold price series did not contain usable values")
 
-    converted.sort(key=lambda item: datetime.fromisoformat(item["date"]))
-    return converted
+def _alpha_columns(
+    time_series: Dict[str, Dict[str, Any]], fields: Mapping[str, str]
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Parse Alpha Vantage rows into date-sorted column arrays, with missing values as NaN.
+
+    ``fields`` maps each output column name to its Alpha Vantage key (e.g. "4. close").
+    """
+    items = list(time_series.items())
+    dates = np.array([date_str for date_str, _ in items], dtype="datetime64[D]")
+    columns = {
+        name: np.fromiter(
+            (_float_or_nan(values.get(field)) for _, values in items),
+            dtype=np.float64,
+            count=len(items),
+        )
+        for name, field in fields.items()
+    }
+    order = np.argsort(dates, kind="stable")
+    return dates[order], {name: column[order] for name, column in columns.items()}
+
+
+def _column_records(dates: np.ndarray, columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Materialize column arrays as ``[{date, ...}]`` rows, mapping NaN back to ``None``."""
+    keys = ["date", *columns]
+    values = [[None if math.isnan(v) else v for v in column.tolist()] for column in columns.values()]
+    date_strs = np.datetime_as_string(dates, unit="D").tolist()
+    return [dict(zip(keys, row)) for row in zip(date_strs, *values)]
 
 
 def _parse_alpha_close_series(time_series: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-    parsed: List[Dict[str, Any]] = []
-    for date_str, values in time_series.items():
-        close = float_or_none(values.get("4. close", ""))
-        if close is None:
-            continue
-        parsed.append({"date": date_str, "close": close})
-    parsed.sort(key=lambda item: datetime.fromisoformat(item["date"]))
-    return parsed
+    dates, columns = _alpha_columns(time_series, {"close": "4. close"})
+    mask = ~np.isnan(columns["close"])
+    return _column_records(dates[mask], {"close": columns["close"][mask]})
 
 
 def _fetch_alpha_daily_close(symbol: str, api_key: str, label: str) -> List[Dict[str, Any]]:
@@ -180,36 +406,73 @@ def _fetch_alpha_daily_close(symbol: str, api_key: str, label: str) -> List[Dict
         "outputsize": "full",
         "apikey": api_key,
     }
-    response = requests.get(ALPHA_BASE_URL, params=params, timeout=30)
-    response.raise_for_status()
-    payload = response.json()
-    _check_alpha_errors(payload, label)
+    payload = _read_cache("alpha_daily", symbol, ALPHA_CACHE_TTL)
+    from_cache = payload is not None
+    if payload is None:
+        payload = _alpha_get(params)
+        _check_alpha_errors(payload, label)
 
     time_series = payload.get("Time Series (Daily)", {})
     parsed = _parse_alpha_close_series(time_series)
     if not parsed:
         raise RuntimeError("Alpha Vantage TIME_SERIES_DAILY returned no close prices")
+    if not from_cache:
+        _write_cache("alpha_daily", symbol, payload)
     return parsed
 
 
-def _xauusd_time_series_or_fred(api_key: str, message: str) -> List[Dict[str, Any]]:
-    """Retry TIME_SERIES_DAILY before falling back to the FRED London AM fix."""
-    print(message)
+def _read_xauusd_source() -> Optional[str]:
+    """Return the XAU/USD endpoint that last worked, or None if unknown or due for a re-probe."""
     try:
-        return _fetch_alpha_daily_close("XAUUSD", api_key, "XAU/USD")
-    except Exception as exc:
-        print(
-            f"TIME_SERIES_DAILY fallback failed for XAU/USD ({exc}). Attempting FRED gold series...",
-            file=sys.stderr,
-        )
-        return _fred_gold_close_series()
+        record = orjson.loads(XAUUSD_SOURCE_FILE.read_bytes())
+        probed = date.fromisoformat(record["probed"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if (date.today() - probed).days >= XAUUSD_SOURCE_MAX_AGE_DAYS:
+        return None
+    return record.get("source")
 
 
-def fetch_alpha_fx(from_symbol: str, to_symbol: str) -> List[Dict[str, Any]]:
-    api_key = os.environ.get("ALPHAVANTAGE_API_KEY")
-    if not api_key:
-        raise RuntimeError("ALPHAVANTAGE_API_KEY is not set")
+def _write_xauusd_source(source: str) -> None:
+    record = {"source": source, "probed": date.today().isoformat()}
+    _write_atomic(XAUUSD_SOURCE_FILE, orjson.dumps(record))
+
+
+def _xauusd_time_series_or_fred(
+    api_key: str, fred_api_key: Optional[str], message: str, failed: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Retry TIME_SERIES_DAILY before falling back to the FRED London AM fix.
+
+    ``failed`` names an endpoint ("ts_daily" or "fred") that already failed during this
+    run, so it is not called a second time.
+    """
+    print(message)
+    if failed == "ts_daily":
+        print("TIME_SERIES_DAILY already failed for XAU/USD. Attempting FRED gold series...")
+        series = _fred_gold_close_series(fred_api_key)
+        source = "fred"
+    else:
+        try:
+            series = _fetch_alpha_daily_close("XAUUSD", api_key, "XAU/USD")
+            source = "ts_daily"
+        except Exception as exc:
+            if failed == "fred":
+                raise
+            print(
+                f"TIME_SERIES_DAILY fallback failed for XAU/USD ({exc}). "
+                "Attempting FRED gold series...",
+                file=sys.stderr,
+            )
+            series = _fred_gold_close_series(fred_api_key)
+            source = "fred"
+    _write_xauusd_source(source)
+    return series
+
 
+def fetch_alpha_fx(
+    from_symbol: str, to_symbol: str, api_key: str, fred_api_key: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Fetch FX_DAILY closes; XAU/USD falls back to TIME_SERIES_DAILY, then FRED gold."""
     params = {
         "function": "FX_DAILY",
         "from_symbol": from_symbol,
@@ -220,23 +483,46 @@ def fetch_alpha_fx(from_symbol: str, to_symbol: str) -> List[Dict[str, Any]]:
 
     is_xauusd = from_symbol.upper() == "XAU" and to_symbol.upper() == "USD"
 
+    cache_ident = f"{from_symbol}{to_symbol}"
+    cached = _read_cache("alpha_fx", cache_ident, ALPHA_CACHE_TTL)
+    if cached is not None:
+        return _parse_alpha_close_series(cached.get("Time Series FX (Daily)", {}))
+
+    # Go straight to the XAU/USD endpoint that worked last time instead of re-probing.
+    preferred = _read_xauusd_source() if is_xauusd else None
+    failed: Optional[str] = None
+    try:
+        if preferred == "ts_daily":
+            return _fetch_alpha_daily_close("XAUUSD", api_key, "XAU/USD")
+        if preferred == "fred":
+            return _fred_gold_close_series(fred_api_key)
+    except Exception as exc:
+        failed = preferred
+        print(
+            f"Cached XAU/USD source {preferred} failed ({exc}). Probing FX_DAILY again...",
+            file=sys.stderr,
+        )
+
     # First try FX_DAILY
     try:
-        response = requests.get(ALPHA_BASE_URL, params=params, timeout=30)
-        response.raise_for_status()
-        payload = response.json()
+        payload = _alpha_get(params)
     except Exception as exc:
         if is_xauusd:
             return _xauusd_time_series_or_fred(
                 api_key,
+                fred_api_key,
                 f"FX_DAILY request failed for XAU/USD ({exc}). Attempting TIME_SERIES_DAILY...",
+                failed=failed,
             )
         raise
 
     error_message = payload.get("Error Message")
     if is_xauusd and error_message and "Invalid API call" in error_message:
         return _xauusd_time_series_or_fred(
-            api_key, "FX_DAILY not available for XAU/USD, retrying TIME_SERIES_DAILY..."
+            api_key,
+            fred_api_key,
+            "FX_DAILY not available for XAU/USD, retrying TIME_SERIES_DAILY...",
+            failed=failed,
         )
 
     try:
@@ -245,7 +531,9 @@ def fetch_alpha_fx(from_symbol: str, to_symbol: str) -> List[Dict[str, Any]]:
         if is_xauusd:
             return _xauusd_time_series_or_fred(
                 api_key,
+                fred_api_key,
                 f"FX_DAILY error for XAU/USD ({exc}). Attempting TIME_SERIES_DAILY...",
+                failed=failed,
             )
         raise
 
@@ -254,94 +542,129 @@ def fetch_alpha_fx(from_symbol: str, to_symbol: str) -> List[Dict[str, Any]]:
     if is_xauusd and not parsed:
         return _xauusd_time_series_or_fred(
             api_key,
+            fred_api_key,
             "FX_DAILY returned no usable data for XAU/USD. Attempting TIME_SERIES_DAILY...",
+            failed=failed,
         )
+    if parsed:
+        _write_cache("alpha_fx", cache_ident, payload)
+    if is_xauusd and preferred != "fx_daily":
+        _write_xauusd_source("fx_daily")
     return parsed
 
 
-def fetch_alpha_equity(symbol: str) -> List[Dict[str, Any]]:
-    api_key = os.environ.get("ALPHAVANTAGE_API_KEY")
-    if not api_key:
-        raise RuntimeError("ALPHAVANTAGE_API_KEY is not set")
-
+def fetch_alpha_equity(symbol: str, api_key: str) -> List[Dict[str, Any]]:
     params = {
         "function": "TIME_SERIES_DAILY_ADJUSTED",
         "symbol": symbol,
         "outputsize": "full",
         "apikey": api_key,
     }
-    response = requests.get(ALPHA_BASE_URL, params=params, timeout=30)
-    response.raise_for_status()
-    payload = response.json()
-    _check_alpha_errors(payload, symbol or "equity")
+    payload = _read_cache("alpha_equity", symbol, ALPHA_CACHE_TTL)
+    from_cache = payload is not None
+    if payload is None:
+        payload = _alpha_get(params)
+        _check_alpha_errors(payload, symbol or "equity")
 
     time_series = payload.get("Time Series (Daily)", {})
-    parsed: List[Dict[str, Any]] = []
-    for date_str, values in time_series.items():
-        close = float_or_none(values.get("4. close", ""))
-        adjusted_close = float_or_none(values.get("5. adjusted close", ""))
-        volume = float_or_none(values.get("6. volume", ""))
-        if close is None and adjusted_close is None:
-            continue
-        parsed.append(
-            {
-                "date": date_str,
-                "close": close,
-                "adjusted_close": adjusted_close,
-                "volume": volume,
-            }
-        )
-
-    parsed.sort(key=lambda item: datetime.fromisoformat(item["date"]))
+    dates, columns = _alpha_columns(
+        time_series,
+        {
+            "close": "4. close",
+            "adjusted_close": "5. adjusted close",
+            "volume": "6. volume",
+        },
+    )
+    mask = ~(np.isnan(columns["close"]) & np.isnan(columns["adjusted_close"]))
+    parsed = _column_records(dates[mask], {name: column[mask] for name, column in columns.items()})
+    # Only cache payloads that actually held data, not e.g. an "Information" notice.
+    if parsed and not from_cache:
+        _write_cache("alpha_equity", symbol, payload)
     return parsed
 
 
 def fetch_cb_sheets(url: str) -> List[Dict[str, Any]]:
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    text = response.text.splitlines()
-    reader = csv.DictReader(text)
+    # Let pandas' C tokenizer parse the streamed body directly; urllib3 still handles
+    # any Content-Encoding because decode_content is enabled on the raw stream.
+    with _SESSION.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        df = pd.read_csv(response.raw, na_values=list(_SENTINELS), parse_dates=["date"])
+
+    value_columns = [column for column in df.columns if column != "date"]
+    df[value_columns] = (
+        df[value_columns].apply(pd.to_numeric, errors="coerce").astype("float64")
+    )
+    df = df.sort_values("date", kind="stable")
+    df["date"] = df["date"].dt.strftime("%Y-%m-%d")
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
 
-    rows: List[Dict[str, Any]] = []
-    for row in reader:
-        normalized: Dict[str, Any] = {
-            k: float_or_none(v) if k.lower() != "date" else v for k, v in row.items()
-        }
-        rows.append(normalized)
+def fetch_series(config: SeriesConfig) -> List[Dict[str, Any]]:
+    """Fetch the series described by ``config`` from its configured source."""
+    if config.source == "fred":
+        assert config.series_id is not None and _FRED_KEY
+        return fetch_fred_series(config.series_id, _FRED_KEY)
+    if config.source == "alpha_fx":
+        assert config.from_symbol and config.to_symbol and _ALPHA_KEY
+        return fetch_alpha_fx(config.from_symbol, config.to_symbol, _ALPHA_KEY, _FRED_KEY)
+    if config.source == "alpha_equity":
+        assert config.symbol and _ALPHA_KEY
+        return fetch_alpha_equity(config.symbol, _ALPHA_KEY)
+    raise ValueError(f"Unsupported source: {config.source}")
 
-    rows.sort(key=lambda item: datetime.fromisoformat(item["date"]))
-    return rows
 
+async def _update_series(config: SeriesConfig) -> None:
+    """Fetch one series and write its JSON and Parquet files as soon as it arrives."""
+    series = await asyncio.to_thread(fetch_series, config)
+    await save_json(config.filename, series)
+    await asyncio.to_thread(save_columnar, Path(config.filename).stem, series)
+
+
+async def _update_cb_sheets(url: str) -> None:
+    rows = await asyncio.to_thread(fetch_cb_sheets, url)
+    await save_json("cb_sheets.json", rows)
+    await asyncio.to_thread(save_columnar, "cb_sheets", rows)
+
+
+async def main() -> int:
+    sources = {config.source for config in SERIES_CONFIG.values()}
+    if "fred" in sources and not _FRED_KEY:
+        raise RuntimeError("FRED_API_KEY is not set")
+    if sources & {"alpha_fx", "alpha_equity"} and not _ALPHA_KEY:
+        raise RuntimeError("ALPHAVANTAGE_API_KEY is not set")
 
-def main() -> int:
     ensure_data_dir()
 
+    # The fetchers are blocking and I/O-bound, so run each one in a worker thread and
+    # wait on all of them together instead of issuing the requests back-to-back.
+    cb_url = os.environ.get("CB_SHEETS_CSV_URL")
+    cb_task: Optional[asyncio.Future[None]] = None
+    if cb_url:
+        print("Fetching central bank balance sheet CSV...")
+        cb_task = asyncio.ensure_future(_update_cb_sheets(cb_url))
+
     for key, config in SERIES_CONFIG.items():
         print(f"Fetching {key} ({config.source})...")
-        if config.source == "fred":
-            assert config.series_id is not None
-            series = fetch_fred_series(config.series_id)
-        elif config.source == "alpha_fx":
-            assert config.from_symbol and config.to_symbol
-            series = fetch_alpha_fx(config.from_symbol, config.to_symbol)
-        elif config.source == "alpha_equity":
-            assert config.symbol
-            series = fetch_alpha_equity(config.symbol)
-        else:
-            raise ValueError(f"Unsupported source: {config.source}")
-        save_json(config.filename, series)
+    results = await asyncio.gather(
+        *(_update_series(config) for config in SERIES_CONFIG.values()),
+        return_exceptions=True,
+    )
 
-    cb_url = os.environ.get("CB_SHEETS_CSV_URL")
-    if cb_url:
+    exit_code = 0
+    for key, result in zip(SERIES_CONFIG, results):
+        if isinstance(result, BaseException):
+            print(f"Error: failed to update {key}: {result}", file=sys.stderr)
+            exit_code = 1
+
+    if cb_task is not None:
         try:
-            print("Fetching central bank balance sheet CSV...")
-            rows = fetch_cb_sheets(cb_url)
-            save_json("cb_sheets.json", rows)
+            await cb_task
         except Exception as exc:  # pragma: no cover - optional data
             print(f"Warning: failed to fetch CB sheets: {exc}", file=sys.stderr)
 
-    return 0
+    return exit_code
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(asyncio.run(main()))